@@ -33,7 +33,7 @@ env_config = {
         "restart": restart,
     },
     "solver":
-        hgym.IPCS,
+        hgym.SemiImplicitBDF,
     "solver_config": {
         "dt": dt,
     },
@@ -14,7 +14,7 @@ class CylEnv(hydrogym.FlowEnv):
     config = {
         "flow": hydrogym.firedrake.Cylinder,
         "flow_config": env_config["flow"],
-        "solver": hydrogym.firedrake.IPCS,
+        "solver": hydrogym.firedrake.SemiImplicitBDF,
         "solver_config": env_config["solver"],
     }
     super().__init__(config)
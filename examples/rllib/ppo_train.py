@@ -46,7 +46,7 @@ if __name__ == "__main__":
               "restart": "../demo/checkpoint-coarse.h5",
               "mesh": "coarse",
           },
-          "solver": hydrogym.firedrake.IPCS,
+          "solver": hydrogym.firedrake.SemiImplicitBDF,
           "solver_config": {
               "dt": 1e-2,
           },
@@ -109,9 +109,9 @@ class CylinderBase(FlowConfig):
     (u, p) = fd.split(q)
     # Lift/drag on cylinder
     force = -dot(self.sigma(u, p), self.n)
-    CL = fd.assemble(2 * force[1] * ds(self.CYLINDER))
-    CD = fd.assemble(2 * force[0] * ds(self.CYLINDER))
-    return CL, CD
+
+    Fx, Fy = self._boundary_force(force, self.CYLINDER)
+    return 2 * Fy, 2 * Fx
 
   # get net shear force acting tangential to the surface of the cylinder
   def shear_force(self, q: fd.Function = None) -> float:
@@ -184,7 +184,7 @@ class CylinderBase(FlowConfig):
       clim = (-2, 2)
     if levels is None:
       levels = np.linspace(*clim, 10)
-    vort = fd.project(fd.curl(self.u), self.pressure_space)
+    vort = self.vorticity()
     im = tricontourf(
         vort,
         cmap=cmap,
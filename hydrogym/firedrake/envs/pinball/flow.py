@@ -5,7 +5,6 @@ import firedrake as fd
 import matplotlib.pyplot as plt
 import numpy as np
 import ufl
-from firedrake import ds
 from firedrake.pyplot import tricontourf
 from ufl import atan2, cos, dot, sin
 
@@ -99,8 +98,12 @@ class Pinball(FlowConfig):
     (u, p) = fd.split(q)
     # Lift/drag on cylinders
     force = -dot(self.sigma(u, p), self.n)
-    CL = [fd.assemble(2 * force[1] * ds(cyl)) for cyl in self.CYLINDER]
-    CD = [fd.assemble(2 * force[0] * ds(cyl)) for cyl in self.CYLINDER]
+
+    CL, CD = [], []
+    for cyl in self.CYLINDER:
+      Fx, Fy = self._boundary_force(force, cyl)
+      CL.append(2 * Fy)
+      CD.append(2 * Fx)
     return CL, CD
 
   def linearize_bcs(self, function_spaces=None):
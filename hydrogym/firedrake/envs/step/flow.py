@@ -35,6 +35,8 @@ class Step(FlowConfig):
   MAX_CONTROL = 0.1  # Arbitrary... should tune this
   TAU = 0.005  # Time constant for controller damping (0.01*instability frequency)
 
+  NOISE_BLOCK_SIZE = 1024  # Number of noise samples generated at once
+
   FLUID = 1
   INLET = 2
   OUTLET = 3
@@ -53,7 +55,10 @@ class Step(FlowConfig):
     self.noise_tau = kwargs.pop("noise_time_constant", 10 * self.TAU)
     self.noise_seed = kwargs.pop("noise_seed", None)
     self.noise_state = fd.Constant(0.0)
+    self._noise_value = 0.0  # Filter state as a float (mirrors `noise_state`)
     self.rng = fd.Generator(fd.PCG64(seed=self.noise_seed))
+    self._noise_samples = np.zeros(self.NOISE_BLOCK_SIZE)
+    self._noise_idx = self.NOISE_BLOCK_SIZE  # Draw a new block on first use
     super().__init__(**kwargs)
 
   @property
@@ -62,7 +67,7 @@ class Step(FlowConfig):
 
   @property
   def nu(self):
-    return fd.Constant(0.5 / ufl.real(self.Re))
+    return 0.5 / ufl.real(self.Re)
 
   @property
   def body_force(self):
@@ -110,20 +115,38 @@ class Step(FlowConfig):
     self.bcu_actuation = [ScaledDirichletBC(V, u_bc, self.CONTROL)]
     self.set_control(self.control_state)
 
+  def next_noise_sample(self) -> float:
+    """Return the next white noise sample for the random forcing
+
+        Samples are generated in blocks of `NOISE_BLOCK_SIZE`, so that the
+        broadcast to all MPI ranks only happens once per block rather than
+        on every time step.
+        """
+    if self._noise_idx == self.NOISE_BLOCK_SIZE:
+      comm = fd.COMM_WORLD
+      # Generate random noise samples on rank zero
+      if comm.rank == 0:
+        self._noise_samples[:] = self.rng.standard_normal(self.NOISE_BLOCK_SIZE)
+
+      # Send the same values to all MPI ranks
+      comm.Bcast(self._noise_samples, root=0)
+      self._noise_idx = 0
+
+    # The block holds unit normals, so that changes to `noise_amplitude`
+    # take effect immediately
+    w = self.noise_amplitude * self._noise_samples[self._noise_idx]
+    self._noise_idx += 1
+    return w
+
   def advance_time(self, dt, control=None):
     # Generate a noise sample
-    comm = fd.COMM_WORLD
-    w = np.zeros(1)
-    # Generate random noise sample on rank zero
-    if comm.rank == 0:
-      w[0] = self.noise_amplitude * self.rng.standard_normal()
-
-    # Send the same value to all MPI ranks
-    comm.Bcast(w, root=0)
-
-    # Update the noise filter
-    x = self.noise_state
-    x.assign(x + dt * (w[0] - x) / self.noise_tau)
+    w = self.next_noise_sample()
+
+    # Update the noise filter in floating point and only push the result to
+    # the Constant, rather than assigning (and evaluating) a UFL expression
+    x = self._noise_value
+    self._noise_value = x + dt * (w - x) / self.noise_tau
+    self.noise_state.assign(self._noise_value)
 
     return super().advance_time(dt, control)
 
@@ -5,7 +5,7 @@ import firedrake as fd
 import numpy as np
 import pyadjoint
 import ufl
-from firedrake import dx, logging
+from firedrake import ds, dx, logging
 from firedrake.__future__ import interpolate
 from mpi4py import MPI
 from numpy.typing import ArrayLike
@@ -19,9 +19,12 @@ from .utils.linalg import DirectOperator, InverseOperator
 class ScaledDirichletBC(fd.DirichletBC):
 
   def __init__(self, V, g, sub_domain, method=None):
-    self.unscaled_function_arg = g
+    # Interpolate the (possibly expensive) profile once, so that applying
+    # the boundary condition only has to rescale a precomputed field
+    self.unscaled_function_arg = fd.Function(V).interpolate(g)
     self._scale = fd.Constant(1.0)
-    super().__init__(V, self._scale * g, sub_domain, method)
+    super().__init__(V, self._scale * self.unscaled_function_arg, sub_domain,
+                     method)
 
   def set_scale(self, c):
     self._scale.assign(c)
@@ -43,13 +46,17 @@ class FlowConfig(PDEBase):
 
   FUNCTIONS = ("q",)  # tuple of functions necessary for the flow
 
-  def __init__(self, velocity_order=None, **config):
+  def __init__(self, velocity_order=None, velocity_variant=None, **config):
     self.Re = fd.Constant(ufl.real(config.get("Re", self.DEFAULT_REYNOLDS)))
 
     if velocity_order is None:
       velocity_order = self.DEFAULT_VELOCITY_ORDER
     self.velocity_order = velocity_order
 
+    # Finite element variant of the velocity space (e.g. "spectral" for
+    # sum-factorized quadrature on quadrilateral/hexahedral meshes)
+    self.velocity_variant = velocity_variant
+
     probes = config.pop("probes", None)
     if probes is None:
       probes = []
@@ -141,8 +148,11 @@ class FlowConfig(PDEBase):
     self.x, self.y = fd.SpatialCoordinate(self.mesh)
 
     # Set up Taylor-Hood elements
-    self.velocity_space = fd.VectorFunctionSpace(self.mesh, "CG",
-                                                 self.velocity_order)
+    variant = self.velocity_variant
+    if variant is None and not self.mesh.ufl_cell().is_simplex():
+      variant = "spectral"
+    self.velocity_space = fd.VectorFunctionSpace(
+        self.mesh, "CG", self.velocity_order, variant=variant)
     self.pressure_space = fd.FunctionSpace(self.mesh, "CG", 1)
     self.mixed_space = fd.MixedFunctionSpace(
         [self.velocity_space, self.pressure_space])
@@ -152,6 +162,12 @@ class FlowConfig(PDEBase):
     self.split_solution()  # Break out and rename main solution
 
     self._vorticity = fd.Function(self.pressure_space, name="vort")
+    self._vorticity_source = None
+
+    # Test function on constant vectors, used to integrate all components of
+    # a boundary force in a single assembly (see `_boundary_force`)
+    self._force_test = fd.TestFunction(
+        fd.VectorFunctionSpace(self.mesh, "R", 0))
 
   def set_state(self, q: fd.Function):
     """Set the current state fields
@@ -189,13 +205,34 @@ class FlowConfig(PDEBase):
 
   @property
   def nu(self):
-    return fd.Constant(1 / ufl.real(self.Re))
+    # Kinematic viscosity in terms of the `Re` Constant, rather than a new
+    # Constant on every access, so all forms share the same coefficient
+    return 1 / ufl.real(self.Re)
 
   def split_solution(self):
     self.u, self.p = self.q.subfunctions
     self.u.rename("u")
     self.p.rename("p")
 
+  def _boundary_force(self, force, marker) -> tuple[float]:
+    """Integrate the components of a traction vector over a boundary
+
+        Args:
+            force (ufl.core.expr.Expr): Traction vector on the boundary
+            marker (int): Boundary marker to integrate over
+
+        Returns:
+            tuple[float]: Integrated (x, y) components of the force
+        """
+    if pyadjoint.annotate_tape():
+      # Keep scalar functionals so that the forces can be differentiated
+      return tuple(
+          fd.assemble(force[i] * ds(marker))
+          for i in range(self.mesh.geometric_dimension()))
+
+    return tuple(
+        fd.assemble(dot(force, self._force_test) * ds(marker)).dat.data_ro)
+
   def vorticity(self, u: fd.Function = None) -> fd.Function:
     """Compute the vorticity field `curl(u)` of the flow
 
@@ -209,7 +246,13 @@ class FlowConfig(PDEBase):
         """
     if u is None:
       u = self.u
-    self._vorticity.project(curl(u))
+
+    # The mass matrix of the projection is fixed, so keep the solver
+    # around for as long as the same velocity field is requested
+    if u is not self._vorticity_source:
+      self._vorticity_projector = fd.Projector(curl(u), self._vorticity)
+      self._vorticity_source = u
+    self._vorticity_projector.project()
     return self._vorticity
 
   def function_spaces(self, mixed: bool = True):
@@ -304,10 +347,10 @@ class FlowConfig(PDEBase):
       super().set_control(act)
 
       if hasattr(self, "bcu_actuation"):
-        for i in range(self.num_inputs):
-          u = np.clip(self.actuators[i].state, -self.MAX_CONTROL,
-                      self.MAX_CONTROL)
-          self.bcu_actuation[i].set_scale(u)
+        # Clip all actuator states at once rather than one at a time
+        u = np.clip(self.control_state, -self.MAX_CONTROL, self.MAX_CONTROL)
+        for bc, u_i in zip(self.bcu_actuation, u):
+          bc.set_scale(u_i)
 
   def inner_product(
       self,
@@ -385,9 +428,8 @@ class FlowConfig(PDEBase):
     return self._complex_shift_inv_operator(
         qB, sigma, adjoint=adjoint, solver_parameters=solver_parameters)
 
-  # TODO: Test this. This is just here as an extension of the work done with
-  # shift-inverse-type operators, but hasn't been directly tested yet. Really
-  # it should be used for linearized time-stepping.
+  # This is here as an extension of the work done with shift-inverse-type
+  # operators. Really it should be used for linearized time-stepping.
   def _jacobian_operator(self, qB, adjoint=False):
     """Construct the Jacobian operator for the Navier-Stokes equations.
 
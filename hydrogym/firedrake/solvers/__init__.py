@@ -1,10 +1,12 @@
 from .base import NewtonSolver
 from .bdf_ext import LinearizedBDF, SemiImplicitBDF
 from .integrate import integrate
+from .pcd import PCDPreconditioner
 
 __all__ = [
     "NewtonSolver",
     "SemiImplicitBDF",
     "LinearizedBDF",
     "integrate",
+    "PCDPreconditioner",
 ]
@@ -5,7 +5,7 @@ from ufl import as_ufl, div, dot, ds, dx, inner, lhs, nabla_grad, rhs
 
 from hydrogym.core import TransientSolver
 from hydrogym.firedrake import FlowConfig
-from hydrogym.firedrake.solvers.stabilization import ns_stabilization
+from hydrogym.firedrake.solvers.stabilization import GradDiv, ns_stabilization
 from hydrogym.firedrake.utils import white_noise
 
 __all__ = ["NewtonSolver"]
@@ -18,9 +18,11 @@ class NewtonSolver:
       flow: FlowConfig,
       stabilization: str = "none",
       solver_parameters: dict = {},
+      graddiv_gamma: float = 1.0,
   ):
     self.flow = flow
     self.solver_parameters = solver_parameters
+    self.graddiv_gamma = graddiv_gamma  # Penalty for "graddiv" stabilization
 
     if stabilization not in ns_stabilization:
       raise ValueError(f"Stabilization type {stabilization} not recognized. "
@@ -53,11 +55,15 @@ class NewtonSolver:
       (v, s) = q_test
 
     F = self.flow.residual((u, p), q_test=(v, s))
+    kwargs = {}
+    if issubclass(self.stabilization_type, GradDiv):
+      kwargs["gamma"] = self.graddiv_gamma
     stab = self.stabilization_type(
         self.flow,
         q_trial=(u, p),
         q_test=(v, s),
         wind=u,
+        **kwargs,
     )
     F = stab.stabilize(F)
 
@@ -79,8 +85,8 @@ class NavierStokesTransientSolver(TransientSolver):
     self.debug = debug
     self.reset()
 
-  def reset(self):
-    super().reset()
+  def reset(self, t=0.0):
+    super().reset(t=t)
 
     self.initialize_functions()
 
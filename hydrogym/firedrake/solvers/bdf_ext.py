@@ -1,9 +1,12 @@
+from collections import deque
+
 import firedrake as fd
 from ufl import div, dot, dx, inner, lhs, nabla_grad, rhs
 
 from ..flow import FlowConfig
+from ..utils.linalg import MUMPS_SOLVER_PARAMETERS
 from .base import NavierStokesTransientSolver
-from .stabilization import ns_stabilization
+from .stabilization import GradDiv, ns_stabilization
 
 __all__ = [
     "SemiImplicitBDF",
@@ -22,6 +25,11 @@ _beta_EXT = [
     [3.0, -3.0, 1.0],
 ]
 
+SOLVER_PRESETS = ("mumps", "superlu_dist", "fieldsplit", "pcd")
+# Presets that solve with a single LU factorization (no Krylov iterations)
+_DIRECT_PRESETS = ("mumps", "superlu_dist")
+_PCD_PC_TYPE = "hydrogym.firedrake.solvers.PCDPreconditioner"
+
 
 class SemiImplicitBDF(NavierStokesTransientSolver):
 
@@ -32,11 +40,33 @@ class SemiImplicitBDF(NavierStokesTransientSolver):
       order: int = 3,
       stabilization: str = "default",
       rtol=1e-6,
+      parallel_preset: str = None,
+      pc_refresh_interval: int = 1,
+      graddiv_gamma: float = 1.0,
       **kwargs,
   ):
     self.k = order  # Order of the BDF/EXT scheme
     self.ksp_rtol = rtol  # Krylov solver tolerance
 
+    # Number of steps between preconditioner rebuilds.  The operator only
+    # changes through the extrapolated wind, so a lagged preconditioner is
+    # often still effective and saves the (AMG) setup cost.
+    self.pc_refresh_interval = pc_refresh_interval
+
+    if parallel_preset is None:
+      parallel_preset = "fieldsplit"
+    if parallel_preset not in SOLVER_PRESETS:
+      raise ValueError(f"Solver preset {parallel_preset} not recognized. "
+                       f"Available options: {SOLVER_PRESETS}")
+    self.parallel_preset = parallel_preset
+
+    # With a direct solve a lagged factorization is applied to the new
+    # operator as-is, so there is no Krylov iteration to correct the result
+    if pc_refresh_interval > 1 and parallel_preset in _DIRECT_PRESETS:
+      raise ValueError(
+          f"pc_refresh_interval > 1 is not supported with the direct solver "
+          f"preset {parallel_preset}")
+
     if stabilization == "default":
       stabilization = flow.DEFAULT_STABILIZATION
 
@@ -45,9 +75,10 @@ class SemiImplicitBDF(NavierStokesTransientSolver):
       raise ValueError(f"Stabilization type {stabilization} not recognized. "
                        f"Available options: {ns_stabilization.keys()}")
     self.StabilizationType = ns_stabilization[stabilization]
+    self.graddiv_gamma = graddiv_gamma  # Penalty for "graddiv" stabilization
 
+    # Note that this also builds the solver (via `reset`)
     super().__init__(flow, dt, **kwargs)
-    self.reset()
 
   def initialize_functions(self):
     flow = self.flow
@@ -61,48 +92,129 @@ class SemiImplicitBDF(NavierStokesTransientSolver):
     self.q_trial = (u, p)
     self.q_test = (w, s)
 
-    # Previous solutions for BDF and extrapolation
-    q_prev = [fd.Function(W) for _ in range(self.k)]
-
-    self.u_prev = [q.subfunctions[0] for q in q_prev]
+    # Previous velocities for BDF and extrapolation (the pressure history
+    # is not needed, so only allocate the velocity space)
+    self.u_prev = deque(fd.Function(flow.velocity_space) for _ in range(self.k))
 
     # Assign the current solution to all `u_prev`
     for u in self.u_prev:
       u.assign(flow.q.subfunctions[0])
 
-  def _make_petsc_solver(self, weak_form):
+    # Linear combinations of the previous solutions entering the weak form.
+    # These are updated in `step` so that the form only references a single
+    # coefficient for each of them.
+    self.w = fd.Function(flow.velocity_space)  # Extrapolated "wind"
+    self.u_BDF = fd.Function(flow.velocity_space)
+
+    # The BDF coefficient is a Constant so that a single solver can be used
+    # for the reduced-order start-up steps as well as the full-order scheme
+    self.alpha = fd.Constant(_alpha_BDF[self.k - 1])
+    self.h = fd.Constant(self.dt)
+    self._order = None  # Current order of the scheme (set in `step`)
+
+  def _make_petsc_solver(self, weak_form, wind, constant_jacobian=False):
     # Construct variational problem and PETSc solver
+    #
+    # If the left-hand side does not change in time, `constant_jacobian`
+    # assembles the operator (and sets up the preconditioner) only once
+    # and re-assembles just the right-hand side on each step.
+    #
+    # The convecting velocity and the time derivative coefficient are passed
+    # to the preconditioner through the application context (used by the PCD
+    # Schur complement approximation)
     q = self.flow.q
     a = lhs(weak_form)
     L = rhs(weak_form)
     bcs = self.flow.collect_bcs()
-    bdf_prob = fd.LinearVariationalProblem(a, L, q, bcs=bcs)
+    bdf_prob = fd.LinearVariationalProblem(
+        a, L, q, bcs=bcs, constant_jacobian=constant_jacobian)
+
+    solver_parameters = self._solver_params(self.parallel_preset)
+    appctx = {
+        "wind": wind,
+        "nu": self.flow.nu,
+        "alpha_h": self.alpha / self.h,
+    }
+    petsc_solver = fd.LinearVariationalSolver(
+        bdf_prob, solver_parameters=solver_parameters, appctx=appctx)
+    return petsc_solver
+
+  def _solver_params(self, strategy):
+    """PETSc options for the linear system solved at each time step
+
+        Available strategies:
+        - "mumps": sparse direct LU, robust but only practical in serial
+            or on a handful of MPI ranks
+        - "superlu_dist": distributed sparse direct LU for moderate numbers
+            of MPI ranks
+        - "fieldsplit" (default): FGMRES with a Schur complement fieldsplit
+            preconditioner, which scales to large numbers of MPI ranks
+        - "pcd": as "fieldsplit", but with the pressure convection-diffusion
+            approximation of the Schur complement (better at high Re)
+        """
+    if strategy == "mumps":
+      return {**MUMPS_SOLVER_PARAMETERS}
+
+    if strategy == "superlu_dist":
+      return {
+          "mat_type": "aij",
+          "ksp_type": "preonly",
+          "pc_type": "lu",
+          "pc_factor_mat_solver_type": "superlu_dist",
+      }
+
+    if strategy == "pcd":
+      solver_parameters = self._solver_params("fieldsplit")
+      solver_parameters.pop("fieldsplit_1_pc_hypre_type")
+      solver_parameters.update({
+          # The PCD approximation does not use an assembled Schur complement
+          "pc_fieldsplit_schur_precondition": "a11",
+          "fieldsplit_1_pc_type": "python",
+          "fieldsplit_1_pc_python_type": _PCD_PC_TYPE,
+          "fieldsplit_1_pcd_Mp_ksp_type": "preonly",
+          "fieldsplit_1_pcd_Mp_pc_type": "bjacobi",
+          "fieldsplit_1_pcd_Mp_sub_pc_type": "ilu",
+          "fieldsplit_1_pcd_Kp_ksp_type": "preonly",
+          "fieldsplit_1_pcd_Kp_pc_type": "hypre",
+          "fieldsplit_1_pcd_Kp_pc_hypre_type": "boomeramg",
+      })
+      return solver_parameters
 
     # Schur complement preconditioner. See:
     # https://www.firedrakeproject.org/demos/saddle_point_systems.py.html
-    solver_parameters = {
+    #
+    # The operator is stored as a nested matrix, so the velocity/pressure
+    # blocks can be handed to the fieldsplit without extracting submatrices
+    return {
+        "mat_type": "nest",
         "ksp_type": "fgmres",
         "ksp_rtol": self.ksp_rtol,
         "pc_type": "fieldsplit",
         "pc_fieldsplit_type": "schur",
+        "pc_fieldsplit_0_fields": "0",  # Velocity
+        "pc_fieldsplit_1_fields": "1",  # Pressure
         "pc_fieldsplit_schur_fact_type": "full",
         "pc_fieldsplit_schur_precondition": "selfp",
         #
-        # Default preconditioner for inv(A)
-        #   (ilu in serial, bjacobi in parallel)
+        # Block Jacobi/ILU preconditioner for inv(A)
+        #   (equivalent to plain ILU in serial)
         "fieldsplit_0_ksp_type": "preonly",
+        "fieldsplit_0_pc_type": "bjacobi",
+        "fieldsplit_0_sub_pc_type": "ilu",
         #
-        # Single multigrid cycle preconditioner for inv(S)
+        # Single multigrid cycle preconditioner for inv(S).  With "selfp"
+        # the Schur complement is assembled on the (smaller) pressure space
+        # as S ~ A11 - A10 diag(A00)^{-1} A01, so this is a single AMG setup
         "fieldsplit_1_ksp_type": "preonly",
         "fieldsplit_1_pc_type": "hypre",
+        "fieldsplit_1_pc_hypre_type": "boomeramg",
     }
 
-    petsc_solver = fd.LinearVariationalSolver(
-        bdf_prob, solver_parameters=solver_parameters)
-    return petsc_solver
-
   def _stabilize_weak_form(self, weak_form, u_t, wind, f=None):
     # Stabilization (SUPG, GLS, etc.)
+    kwargs = {}
+    if issubclass(self.StabilizationType, GradDiv):
+      kwargs["gamma"] = self.graddiv_gamma
     stab = self.StabilizationType(
         self.flow,
         self.q_trial,
@@ -111,24 +223,23 @@ class SemiImplicitBDF(NavierStokesTransientSolver):
         dt=self.dt,
         u_t=u_t,
         f=f,
+        **kwargs,
     )
     return stab.stabilize(weak_form)
 
-  def _make_order_k_solver(self, k):
+  def _make_bdf_solver(self):
     # Setup functions and spaces
     flow = self.flow
-    h = fd.Constant(self.dt)
+    h = self.h
 
     (u, p) = self.q_trial
     (v, s) = self.q_test
 
     # Combinations of functions for form construction
-    k_idx = k - 1
     # The "wind" w is the extrapolation estimate of u[n+1]
-    w = sum(beta * u_n for beta, u_n in zip(_beta_EXT[k_idx], self.u_prev))
-    u_BDF = sum(beta * u_n for beta, u_n in zip(_beta_BDF[k_idx], self.u_prev))
-    alpha_k = _alpha_BDF[k_idx]
-    u_t = (alpha_k * u - u_BDF) / h  # BDF estimate of time derivative
+    w = self.w
+    u_BDF = self.u_BDF
+    u_t = (self.alpha * u - u_BDF) / h  # BDF estimate of time derivative
 
     # Semi-implicit weak form
     weak_form = (
@@ -137,17 +248,26 @@ class SemiImplicitBDF(NavierStokesTransientSolver):
         dot(self.f, v) * dx)
 
     weak_form = self._stabilize_weak_form(weak_form, u_t, wind=w, f=self.f)
-    return self._make_petsc_solver(weak_form)
+    return self._make_petsc_solver(weak_form, wind=w)
 
   def initialize_operators(self):
     self.flow.init_bcs()
-    self.petsc_solver = self._make_order_k_solver(self.k)
+    self.petsc_solver = self._make_bdf_solver()
 
-    # Start-up solvers for BDF/EXT schemes
-    self.startup_solvers = []
-    if self.k > 1:
-      for i in range(self.k - 1):
-        self.startup_solvers.append(self._make_order_k_solver(i + 1))
+  def _update_history(self, k):
+    """Set the BDF/EXT coefficients and history combinations for order `k`"""
+    k_idx = k - 1
+    if k != self._order:
+      # The BDF coefficient enters the operator, so make sure it is
+      # re-assembled even if it is otherwise held constant
+      self.alpha.assign(_alpha_BDF[k_idx])
+      self.petsc_solver.invalidate_jacobian()
+      self._order = k
+
+    self.w.assign(
+        sum(beta * u_n for beta, u_n in zip(_beta_EXT[k_idx], self.u_prev)))
+    self.u_BDF.assign(
+        sum(beta * u_n for beta, u_n in zip(_beta_BDF[k_idx], self.u_prev)))
 
   def step(self, iter, control=None):
     # Update the time of the flow
@@ -155,16 +275,25 @@ class SemiImplicitBDF(NavierStokesTransientSolver):
     bc_scale = self.flow.advance_time(self.dt, control)
     self.flow.set_control(bc_scale)
 
-    # Solve the linear problem
-    if iter > self.k - 1:
-      self.petsc_solver.solve()
-    else:
-      self.startup_solvers[iter - 1].solve()
+    # Reduced-order BDF/EXT scheme until there is enough history
+    k = min(iter + 1, self.k)
+    # Set the reuse flag on every step, so that lowering the refresh
+    # interval back to 1 also turns reuse off again.  Direct solves always
+    # refactorize, since a stale LU factor would give a wrong solution.
+    refresh_pc = (
+        self.pc_refresh_interval <= 1 or
+        self.parallel_preset in _DIRECT_PRESETS or k != self._order or
+        iter % self.pc_refresh_interval == 0)
+    self.petsc_solver.snes.ksp.setReusePreconditioner(not refresh_pc)
+    self._update_history(k)
 
-    # Store the historical solutions for BDF/EXT estimates
-    for i in range(self.k - 1):
-      self.u_prev[-(i + 1)].assign(self.u_prev[-(i + 2)])
+    # Solve the linear problem
+    self.petsc_solver.solve()
 
+    # Store the historical solutions for BDF/EXT estimates.  The forms only
+    # depend on `self.w` and `self.u_BDF`, so the oldest solution can simply
+    # be recycled for the newest one rather than shifting the whole history.
+    self.u_prev.rotate(1)
     self.u_prev[0].assign(self.flow.q.subfunctions[0])
 
     return self.flow
@@ -180,12 +309,12 @@ class LinearizedBDF(SemiImplicitBDF):
     stabilization = "_".join(stabilization)
     super().__init__(*args, stabilization=stabilization, **kwargs)
 
-  def _make_order_k_solver(self, k):
+  def _make_bdf_solver(self):
     # Setup functions and spaces
     flow = self.flow
     sigma, epsilon = flow.sigma, flow.epsilon
 
-    h = fd.Constant(self.dt)
+    h = self.h
 
     flow.linearize_bcs()
 
@@ -194,10 +323,8 @@ class LinearizedBDF(SemiImplicitBDF):
     (v, s) = self.q_test
 
     # Combinations of functions for form construction
-    k_idx = k - 1
-    u_BDF = sum(beta * u_n for beta, u_n in zip(_beta_BDF[k_idx], self.u_prev))
-    alpha_k = _alpha_BDF[k_idx]
-    u_t = (alpha_k * u - u_BDF) / h  # BDF estimate of time derivative
+    u_BDF = self.u_BDF
+    u_t = (self.alpha * u - u_BDF) / h  # BDF estimate of time derivative
 
     # Semi-implicit weak form
     # Note that the base flow terms are added to the RHS in `self.f`
@@ -215,7 +342,9 @@ class LinearizedBDF(SemiImplicitBDF):
     f_stab = self.f  # - dot(uB, nabla_grad(uB)) + div(sigma(uB, pB))
 
     weak_form = self._stabilize_weak_form(weak_form, u_t, wind=uB, f=f_stab)
-    return self._make_petsc_solver(weak_form)
+
+    # The operator only depends on the (fixed) base flow
+    return self._make_petsc_solver(weak_form, wind=uB, constant_jacobian=True)
 
   # def initialize_functions(self):
   #     # Add to the RHS forcing with base flow terms
@@ -10,7 +10,7 @@ from ufl import div, dot, dx, inner, nabla_grad
 if TYPE_CHECKING:
   from ..flow import FlowConfig
 
-__all__ = ["SUPG", "GLS", "ns_stabilization"]
+__all__ = ["SUPG", "GLS", "GradDiv", "ns_stabilization"]
 
 
 @dataclasses.dataclass
@@ -28,6 +28,17 @@ class NavierStokesStabilization(metaclass=abc.ABCMeta):
     return weak_form
 
 
+@dataclasses.dataclass
+class GradDiv(NavierStokesStabilization):
+  # Penalty on the divergence of the velocity (Olshanskii & Reusken, 2004)
+  gamma: float | fd.Constant = 1.0
+
+  def stabilize(self, weak_form):
+    (u, _) = self.q_trial
+    (v, _) = self.q_test
+    return weak_form + self.gamma * inner(div(u), div(v)) * dx
+
+
 class UpwindNSStabilization(NavierStokesStabilization):
 
   @property
@@ -158,7 +169,9 @@ ns_stabilization = {
     "none": NavierStokesStabilization,
     "supg": SUPG,
     "gls": GLS,
+    "graddiv": GradDiv,
     "linearized_none": NavierStokesStabilization,
     "linearized_supg": LinearizedSUPG,
     "linearized_gls": LinearizedGLS,
+    "linearized_graddiv": GradDiv,
 }
@@ -29,25 +29,40 @@ class LinearOperator(metaclass=abc.ABCMeta):
     pass
 
 
+@dataclasses.dataclass
 class DirectOperator(LinearOperator):
+  """Matrix-free action of a bilinear form.
+
+    The output is assembled in place into a preallocated Cofunction, so as
+    with `InverseOperator` this object will own the output Function unless
+    `copy_output=True` is set.
+    """
+
   J: ufl.Form
   bcs: list[fd.DirichletBC]
   function_space: fd.FunctionSpace
+  copy_output: bool = False
+
+  def __post_init__(self):
+    self._v = fd.Function(self.function_space)
+    self._action = ufl.action(self.J, self._v)
+    self._f_bar = fd.Cofunction(self.function_space.dual())
+    self._f = fd.Function(self.function_space, val=self._f_bar.dat)
 
   def __matmul__(self, v: fd.Function):
-    f_bar = fd.assemble(self.J @ v, bcs=self.bcs)  # Cofunction
-    return fd.Function(self.function_space, val=f_bar.dat)
+    self._v.assign(v)
+    fd.assemble(self._action, bcs=self.bcs, tensor=self._f_bar)
+    if self.copy_output:
+      return self._f.copy(deepcopy=True)
+    return self._f
 
   @property
-  def T(self) -> InverseOperator:
-    """Return the adjoint operator.
-
-        This will solve the matrix pencil A^T @ f = M^T @ v0 for f.
-        """
+  def T(self) -> DirectOperator:
+    """Return the adjoint operator."""
     cls = self.__class__
     args = self.J.arguments()
     JT = ufl.adjoint(self.J, reordered_arguments=(args[0], args[1]))
-    return cls(JT, self.bcs, self.function_space)
+    return cls(JT, self.bcs, self.function_space, self.copy_output)
 
 
 @dataclasses.dataclass
@@ -1,5 +1,6 @@
 import firedrake as fd
 import numpy as np
+import pytest
 
 import hydrogym.firedrake as hgym
 from hydrogym.firedrake.utils.pd import PDController
@@ -41,6 +42,86 @@ def test_steady_rotation(tol=1e-3):
   assert abs(CD - 1.49) < tol  # Re = 100
 
 
+def _run_bdf(num_steps=5, dt=1e-2, **solver_kwargs):
+  flow = hgym.Cylinder(Re=100, mesh="medium")
+  solver = hgym.SemiImplicitBDF(flow, dt=dt, **solver_kwargs)
+
+  for iter in range(num_steps):
+    solver.step(iter)
+
+  return np.array(flow.compute_forces())
+
+
+@pytest.mark.parametrize("preset", ["superlu_dist", "fieldsplit", "pcd"])
+def test_solver_presets(preset, tol=1e-4):
+  # Compare against the direct solver
+  forces_ref = _run_bdf(parallel_preset="mumps")
+  forces = _run_bdf(parallel_preset=preset)
+  assert np.allclose(forces, forces_ref, atol=tol)
+
+
+def test_pc_refresh_interval(rtol=1e-4):
+  forces_ref = _run_bdf(num_steps=10)
+  forces = _run_bdf(num_steps=10, pc_refresh_interval=4)
+  assert np.allclose(forces, forces_ref, rtol=rtol)
+
+
+@pytest.mark.parametrize("preset", ["mumps", "superlu_dist"])
+def test_pc_refresh_interval_direct(preset):
+  # A lagged LU factorization would silently give wrong answers
+  flow = hgym.Cylinder(Re=100, mesh="medium")
+  with pytest.raises(ValueError):
+    hgym.SemiImplicitBDF(
+        flow, dt=1e-2, parallel_preset=preset, pc_refresh_interval=4)
+
+
+def test_unknown_preset():
+  flow = hgym.Cylinder(Re=100, mesh="medium")
+  with pytest.raises(ValueError):
+    hgym.SemiImplicitBDF(flow, dt=1e-2, parallel_preset="cholesky")
+
+
+def _div_norm(flow):
+  return np.sqrt(fd.assemble(fd.div(flow.u)**2 * fd.dx))
+
+
+def test_graddiv_stabilization(tol=1e-2):
+  dt = 1e-2
+  div_norms, forces = {}, {}
+  for stabilization in ("none", "graddiv"):
+    flow = hgym.Cylinder(Re=100, mesh="medium")
+    solver = hgym.SemiImplicitBDF(
+        flow, dt=dt, stabilization=stabilization, graddiv_gamma=10.0)
+
+    for iter in range(5):
+      solver.step(iter)
+
+    div_norms[stabilization] = _div_norm(flow)
+    forces[stabilization] = np.array(flow.compute_forces())
+
+  # The penalty should reduce the divergence error without changing the forces
+  assert div_norms["graddiv"] < div_norms["none"]
+  assert np.allclose(forces["graddiv"], forces["none"], atol=tol)
+
+
+def test_linearized_graddiv_stabilization():
+  dt = 1e-2
+  div_norms = {}
+  for stabilization in ("none", "graddiv"):
+    flow = hgym.Cylinder(Re=100, mesh="medium")
+    qB = hgym.NewtonSolver(flow).solve()
+
+    solver = hgym.LinearizedBDF(
+        flow, dt=dt, qB=qB, stabilization=stabilization, graddiv_gamma=10.0)
+
+    for iter in range(5):
+      solver.step(iter)
+
+    div_norms[stabilization] = _div_norm(flow)
+
+  assert div_norms["graddiv"] < div_norms["none"]
+
+
 def test_integrate():
   flow = hgym.Cylinder(mesh="medium")
   dt = 1e-2
@@ -106,6 +187,26 @@ def test_linearize():
   A_adj, M = hgym.modeling.linearize(flow, qB, adjoint=True, backend="scipy")
 
 
+def test_jacobian_operator():
+  flow = hgym.Cylinder(mesh="medium")
+
+  solver = hgym.NewtonSolver(flow)
+  qB = solver.solve()
+
+  v = fd.Function(flow.mixed_space)
+  v.assign(qB)
+
+  A = flow.linearize(qB)
+  f = A @ v
+  assert f.function_space() == flow.mixed_space
+  assert A @ v is f  # The operator owns its output by default
+
+  A.copy_output = True
+  AT = A.T
+  assert AT.copy_output
+  assert AT @ v is not AT @ v
+
+
 def test_act_implicit_no_damp():
   flow = hgym.Cylinder(mesh="medium", actuator_integration="implicit")
   # dt = 1e-2
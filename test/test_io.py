@@ -11,9 +11,9 @@ def test_checkpointing(tmp_dir="tmp"):
   env_config = {
       "flow": hgym.Cylinder,
       "flow_config": {
-          "mesh": "coarse",  # Default mesh
+          "mesh": "medium",  # Default mesh
       },
-      "solver": hgym.IPCS,
+      "solver": hgym.SemiImplicitBDF,
   }
   env = hgym.FlowEnv(env_config)
 
@@ -22,26 +22,26 @@ def test_checkpointing(tmp_dir="tmp"):
     env.step(1)
 
   env.flow.save_checkpoint(checkpoint_path)
-  omega = env.flow.actuators[0].value
+  omega = env.flow.actuators[0].state
 
   # new environment loading checkpoint
   env_config2 = {
       "flow": hgym.Cylinder,
       "flow_config": {
-          "mesh": "coarse",  # Default mesh
+          "mesh": "medium",  # Default mesh
           "restart": checkpoint_path,
       },
-      "solver": hgym.IPCS,
+      "solver": hgym.SemiImplicitBDF,
   }
   env2 = hgym.FlowEnv(env_config2)
 
   # env2.reset()
-  omega2 = env2.flow.actuators[0].value
+  omega2 = env2.flow.actuators[0].state
   assert omega == omega2
 
   # Check that resetting still clears the actuator state
   env2.reset()
-  omega3 = env2.flow.actuators[0].value
+  omega3 = env2.flow.actuators[0].state
   assert omega3 == 0.0
 
 